@@ -5,7 +5,7 @@ A hybrid circuit breaker implementation with configurable fixed and exponential
 Designed for fault tolerance and service resilience in distributed systems.
 """
 
-from .circuit_breaker import CircuitBreaker, CircuitBreakerState
+from .circuit_breaker import CircuitBreaker, CircuitBreakerOpenError, CircuitBreakerState
 
 __version__ = "1.0.0"
-__all__ = ["CircuitBreaker", "CircuitBreakerState"]
+__all__ = ["CircuitBreaker", "CircuitBreakerOpenError", "CircuitBreakerState"]
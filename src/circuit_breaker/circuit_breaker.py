@@ -1,7 +1,8 @@
-import random
-import time
 from collections.abc import Callable
 from enum import Enum
+from random import random as _random
+from threading import Lock
+from time import monotonic_ns as _mono_ns
 from typing import Any, TypeVar
 
 
@@ -14,7 +15,64 @@ class CircuitBreakerState(Enum):
 T = TypeVar("T")
 
 
+class CircuitBreakerOpenError(Exception):
+  """Raised when a call is rejected because the circuit is OPEN or a HALF_OPEN trial is running"""
+
+  __slots__ = ("timeout_minutes", "state")
+
+  def __init__(self, timeout_minutes: int, state: CircuitBreakerState = CircuitBreakerState.OPEN):
+    super().__init__(timeout_minutes)
+    self.timeout_minutes = timeout_minutes
+    self.state = state
+
+  def __reduce__(self) -> tuple[Any, ...]:
+    # BaseException rebuilds from args alone, which would drop the state
+    return type(self), (self.timeout_minutes, self.state)
+
+  def __str__(self) -> str:
+    # Formatted on demand; callers routing on the exception type never pay for it
+    if self.state is CircuitBreakerState.HALF_OPEN:
+      return "Circuit breaker is HALF_OPEN. A trial call is in progress; retry shortly."
+    return (
+      f"Circuit breaker is OPEN. Service unavailable. Next retry in {self.timeout_minutes} minutes."
+    )
+
+
+# Module-level aliases so state checks are identity comparisons against a global
+_CLOSED = CircuitBreakerState.CLOSED
+_OPEN = CircuitBreakerState.OPEN
+_HALF_OPEN = CircuitBreakerState.HALF_OPEN
+
+# Exponential attempts precomputed eagerly; later ones are computed on demand so a huge
+# max_exponential_retries cannot make construction build ever larger bigint powers
+_PRECOMPUTED_EXPONENTIAL_ATTEMPTS = 32
+
+# Per-process slots that __getstate__ leaves out and __setstate__ recreates
+_UNPICKLED_SLOTS = frozenset(("_lock", "_trial_in_flight", "__weakref__", "__dict__"))
+
+
 class CircuitBreaker:
+  __slots__ = (
+    "failure_threshold",
+    "_base_interval_minutes",
+    "_fixed_interval_retries",
+    "_max_exponential_retries",
+    "_jitter_enabled",
+    "failure_count",
+    "consecutive_circuit_breaks",
+    "_last_failure_ns",
+    "_has_failed",
+    "_state",
+    "_state_name",
+    "_trial_in_flight",
+    "_timeouts",
+    "_exponential_retry_phases",
+    "_fixed_retry_phase",
+    "_config_dict",
+    "_lock",
+    "__weakref__",
+  )
+
   def __init__(
     self,
     failure_threshold: int = 5,
@@ -24,126 +82,307 @@ class CircuitBreaker:
     jitter_enabled: bool = True,
   ):
     self.failure_threshold = failure_threshold
-    self.base_interval_minutes = base_interval_minutes
-    self.fixed_interval_retries = fixed_interval_retries
-    self.max_exponential_retries = max_exponential_retries
-    self.jitter_enabled = jitter_enabled
+    self._base_interval_minutes = base_interval_minutes
+    self._fixed_interval_retries = fixed_interval_retries
+    self._max_exponential_retries = max_exponential_retries
+    self._jitter_enabled = jitter_enabled
+    self._rebuild_config_tables()
 
     self.failure_count = 0
     self.consecutive_circuit_breaks = 0  # Track consecutive circuit breaker trips
-    self.last_failure_time: float | None = None
-    self.state = CircuitBreakerState.CLOSED
+    # Monotonic clock, so wall-clock adjustments cannot stretch or cut recovery windows
+    self._last_failure_ns = 0
+    self._has_failed = False
+    self.state = _CLOSED
+
+    # Guards state transitions; the protected function itself always runs outside the lock
+    self._lock = Lock()
+
+  def __getstate__(self) -> dict[str, Any]:
+    # Locks cannot be pickled, so __setstate__ gives the copy a fresh one. Weak references
+    # belong to the original object. Subclasses may add their own slots or a __dict__.
+    state: dict[str, Any] = dict(getattr(self, "__dict__", {}))
+    for cls in type(self).__mro__:
+      slots = cls.__dict__.get("__slots__", ())
+      for name in (slots,) if isinstance(slots, str) else slots:
+        if name not in _UNPICKLED_SLOTS and hasattr(self, name):
+          state[name] = getattr(self, name)
+    # Monotonic readings only mean something within one boot on one host, so carry the time
+    # elapsed since the failure instead and re-anchor it on the unpickling side
+    state["_failure_elapsed_ns"] = _mono_ns() - state.pop("_last_failure_ns")
+    return state
+
+  def __setstate__(self, state: dict[str, Any]) -> None:
+    state = dict(state)
+    self._last_failure_ns = _mono_ns() - state.pop("_failure_elapsed_ns")
+    for name, value in state.items():
+      setattr(self, name, value)
+    self._trial_in_flight = False
+    self._lock = Lock()
+
+  def _rebuild_config_tables(self) -> None:
+    """Precompute everything derived from the retry configuration"""
+    fixed_interval_retries = self._fixed_interval_retries
+    max_exponential_retries = self._max_exponential_retries
+
+    # Timeouts indexed by exponential attempt: entry 0 covers the fixed-interval phase. The
+    # table stops at the exponential cap or _PRECOMPUTED_EXPONENTIAL_ATTEMPTS, whichever is
+    # lower, so it grows with neither retry setting.
+    precomputed_attempts = min(max(0, max_exponential_retries), _PRECOMPUTED_EXPONENTIAL_ATTEMPTS)
+    self._timeouts: list[int] = [
+      self._compute_timeout_minutes(exponential_attempt)
+      for exponential_attempt in range(precomputed_attempts + 1)
+    ]
+
+    # Exponential-phase descriptions for the same attempts. Fixed-interval ones are formatted
+    # on demand and cached for the current break count.
+    attempts = (
+      range(1, precomputed_attempts + 1)
+      if max_exponential_retries > 0
+      else (max_exponential_retries,)
+    )
+    self._exponential_retry_phases: list[str] = [
+      f"exponential-interval (attempt {attempt}/{max_exponential_retries})" for attempt in attempts
+    ]
+    self._fixed_retry_phase: tuple[int, str] = (0, "closed")
+
+    # Copied into each get_status_info() result so callers cannot alter later scrapes
+    self._config_dict: dict[str, Any] = {
+      "base_interval_minutes": self._base_interval_minutes,
+      "fixed_interval_retries": fixed_interval_retries,
+      "max_exponential_retries": max_exponential_retries,
+      "jitter_enabled": self._jitter_enabled,
+    }
+
+  # Configuration setters rebuild the precomputed tables so they never go stale
+
+  @property
+  def base_interval_minutes(self) -> int:
+    return self._base_interval_minutes
+
+  @base_interval_minutes.setter
+  def base_interval_minutes(self, base_interval_minutes: int) -> None:
+    self._base_interval_minutes = base_interval_minutes
+    self._rebuild_config_tables()
+
+  @property
+  def fixed_interval_retries(self) -> int:
+    return self._fixed_interval_retries
+
+  @fixed_interval_retries.setter
+  def fixed_interval_retries(self, fixed_interval_retries: int) -> None:
+    self._fixed_interval_retries = fixed_interval_retries
+    self._rebuild_config_tables()
+
+  @property
+  def max_exponential_retries(self) -> int:
+    return self._max_exponential_retries
+
+  @max_exponential_retries.setter
+  def max_exponential_retries(self, max_exponential_retries: int) -> None:
+    self._max_exponential_retries = max_exponential_retries
+    self._rebuild_config_tables()
+
+  @property
+  def jitter_enabled(self) -> bool:
+    return self._jitter_enabled
+
+  @jitter_enabled.setter
+  def jitter_enabled(self, jitter_enabled: bool) -> None:
+    # Jitter feeds none of the precomputed tables, only the reported config
+    self._jitter_enabled = jitter_enabled
+    self._config_dict["jitter_enabled"] = jitter_enabled
+
+  @property
+  def state(self) -> CircuitBreakerState:
+    return self._state
+
+  @state.setter
+  def state(self, state: CircuitBreakerState) -> None:
+    # Cache the serialized name alongside the state; any HALF_OPEN trial ends on a change
+    self._state = state
+    self._state_name = state.value
+    self._trial_in_flight = False
 
   def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
-    """Execute function with circuit breaker protection"""
-    if self.state == CircuitBreakerState.OPEN:
-      if self._should_attempt_reset():
-        self.state = CircuitBreakerState.HALF_OPEN
-      else:
-        current_timeout_minutes = self._get_current_recovery_timeout_minutes()
-        raise Exception(
-          f"Circuit breaker is OPEN. Service unavailable. Next retry in {current_timeout_minutes} minutes."
-        )
+    """Execute function with circuit breaker protection; safe to call from multiple threads"""
+    # CLOSED is the common case, so it is checked first and handled inline
+    if self._state is _CLOSED:
+      try:
+        result = func(*args, **kwargs)
+        self._on_success()
+        return result
+      except Exception:
+        self._on_failure()
+        raise
+    return self._call_guarded(func, args, kwargs)
+
+  def _call_guarded(
+    self, func: Callable[..., T], args: tuple[Any, ...], kwargs: dict[str, Any]
+  ) -> T:
+    """Execute function while OPEN or HALF_OPEN, admitting one trial call at a time"""
+    with self._lock:
+      state = self._state
+      if state is _OPEN:
+        should_reset, current_timeout_minutes = self._should_attempt_reset()
+        if not should_reset:
+          raise CircuitBreakerOpenError(current_timeout_minutes)
+        self.state = state = _HALF_OPEN
+      elif state is _HALF_OPEN and self._trial_in_flight:
+        # Another caller is already testing the service, which may finish at any moment
+        raise CircuitBreakerOpenError(0, _HALF_OPEN)
+      # The state may have been CLOSED by another thread while we waited, in which case this
+      # is an ordinary call and must not touch the trial slot
+      is_trial = state is _HALF_OPEN
+      if is_trial:
+        self._trial_in_flight = True
 
     try:
       result = func(*args, **kwargs)
       self._on_success()
       return result
-    except Exception as e:
-      self._on_failure()
-      raise e
-
-  def _should_attempt_reset(self) -> bool:
-    """Check if enough time has passed to attempt reset"""
-    if self.last_failure_time is None:
-      return True
+    except Exception:
+      self._on_failure(is_trial)
+      raise
+    except BaseException:
+      if is_trial:
+        # Interrupted trial (e.g. KeyboardInterrupt): let the next caller test the service
+        with self._lock:
+          self._trial_in_flight = False
+      raise
+
+  def _should_attempt_reset(self) -> tuple[bool, int]:
+    """Check if enough time has passed to attempt reset, along with the timeout used"""
     current_timeout_minutes = self._get_current_recovery_timeout_minutes()
-    current_timeout_seconds = current_timeout_minutes * 60
-    return time.time() - self.last_failure_time >= current_timeout_seconds
+    if not self._has_failed:
+      return True, current_timeout_minutes
+    return (
+      _mono_ns() - self._last_failure_ns >= current_timeout_minutes * 60_000_000_000,
+      current_timeout_minutes,
+    )
+
+  def _compute_timeout_minutes(self, exponential_attempt: int) -> int:
+    """Calculate the non-jittered timeout for a given exponential attempt"""
+    # Phase 1: Fixed-interval retries (first N attempts) have a non-positive attempt.
+    if exponential_attempt <= 0:
+      return self._base_interval_minutes
+
+    # Phase 2: Exponential-interval retries
+    # Calculate: base_interval * (base_interval ^ exponential_attempt)
+    # For base=5: 5^1=5, 5^2=25, 5^3=125, 5^4=625, etc.
+    timeout_minutes: int = self._base_interval_minutes * (
+      self._base_interval_minutes**exponential_attempt
+    )
+    return timeout_minutes
 
   def _get_current_recovery_timeout_minutes(self) -> int:
     """Calculate current recovery timeout using hybrid fixed/exponential pattern"""
     if self.consecutive_circuit_breaks == 0:
-      return self.base_interval_minutes
+      return self._base_interval_minutes
 
-    # Phase 1: Fixed-interval retries (first N attempts)
-    if self.consecutive_circuit_breaks <= self.fixed_interval_retries:
-      timeout_minutes = self.base_interval_minutes
+    # Clamp to the fixed-interval entry below and to the exponential cap above
+    timeouts = self._timeouts
+    exponential_attempt = min(
+      max(self.consecutive_circuit_breaks - self._fixed_interval_retries, 0),
+      max(self._max_exponential_retries, 0),
+    )
+    if exponential_attempt < len(timeouts):
+      timeout_minutes = timeouts[exponential_attempt]
     else:
-      # Phase 2: Exponential-interval retries
-      exponential_attempt = self.consecutive_circuit_breaks - self.fixed_interval_retries
-
-      # Cap exponential retries
-      if exponential_attempt > self.max_exponential_retries:
-        exponential_attempt = self.max_exponential_retries
-
-      # Calculate: base_interval * (base_interval ^ exponential_attempt)
-      # For base=5: 5^1=5, 5^2=25, 5^3=125, 5^4=625, etc.
-      timeout_minutes = self.base_interval_minutes * (
-        self.base_interval_minutes**exponential_attempt
-      )
+      timeout_minutes = self._compute_timeout_minutes(exponential_attempt)
 
     # Add jitter (±10% randomness) to prevent thundering herd
-    if self.jitter_enabled:
+    if self._jitter_enabled:
       jitter_range = max(1, int(timeout_minutes * 0.1))
-      jitter = random.randint(-jitter_range, jitter_range)
+      # One random() draw picks uniformly from the integers in [-jitter_range, jitter_range]
+      jitter = int(_random() * (2 * jitter_range + 1)) - jitter_range
       timeout_minutes = max(1, timeout_minutes + jitter)
 
     return timeout_minutes
 
   def _on_success(self) -> None:
     """Handle successful call"""
-    self.failure_count = 0
-    self.consecutive_circuit_breaks = 0  # Reset consecutive breaks on success
-    self.state = CircuitBreakerState.CLOSED
-
-  def _on_failure(self) -> None:
-    """Handle failed call"""
-    self.failure_count += 1
-    self.last_failure_time = time.time()
-
-    if self.failure_count >= self.failure_threshold:
-      if self.state == CircuitBreakerState.HALF_OPEN:
-        # If we failed in HALF_OPEN state, increment consecutive breaks
-        self.consecutive_circuit_breaks += 1
-      else:
-        # First time opening the circuit
-        self.consecutive_circuit_breaks = 1
-      self.state = CircuitBreakerState.OPEN
+    # Fast path: a healthy CLOSED breaker has nothing to reset, so skip the lock
+    if self._state is _CLOSED and not self.failure_count and not self.consecutive_circuit_breaks:
+      return
+
+    with self._lock:
+      # Straight-line stores with no reads in between
+      self.state = _CLOSED
+      self.failure_count = 0
+      self.consecutive_circuit_breaks = 0  # Reset consecutive breaks on success
+
+  def _on_failure(self, is_trial: bool = False) -> None:
+    """Handle failed call, releasing the HALF_OPEN trial slot if this call held it"""
+    with self._lock:
+      if is_trial:
+        self._trial_in_flight = False
+      self.failure_count += 1
+      if self._state is _OPEN:
+        # Already open: the recorded failure time anchors the current recovery window
+        return
+
+      if self.failure_count >= self.failure_threshold:
+        if self._state is _HALF_OPEN:
+          # If we failed in HALF_OPEN state, increment consecutive breaks
+          self.consecutive_circuit_breaks += 1
+        else:
+          # First time opening the circuit
+          self.consecutive_circuit_breaks = 1
+        self._last_failure_ns = _mono_ns()
+        self._has_failed = True
+        self.state = _OPEN
+
+  def _describe_retry_phase(self, consecutive_circuit_breaks: int) -> str:
+    """Describe the retry phase for a given number of consecutive circuit breaks"""
+    if consecutive_circuit_breaks <= 0:
+      return "closed"
+
+    fixed_interval_retries = self._fixed_interval_retries
+    if consecutive_circuit_breaks <= fixed_interval_retries:
+      cached_breaks, retry_phase = self._fixed_retry_phase
+      if cached_breaks != consecutive_circuit_breaks:
+        retry_phase = (
+          f"fixed-interval (attempt {consecutive_circuit_breaks}/{fixed_interval_retries})"
+        )
+        self._fixed_retry_phase = (consecutive_circuit_breaks, retry_phase)
+      return retry_phase
+
+    # Capped at the last attempt; max_exponential_retries <= 0 has a single entry
+    retry_phases = self._exponential_retry_phases
+    max_exponential_retries = self._max_exponential_retries
+    exponential_attempt = min(
+      consecutive_circuit_breaks - fixed_interval_retries, max(max_exponential_retries, 1)
+    )
+    if exponential_attempt <= len(retry_phases):
+      return retry_phases[exponential_attempt - 1]
+    return f"exponential-interval (attempt {exponential_attempt}/{max_exponential_retries})"
 
   def get_status_info(self) -> dict[str, Any]:
     """Get detailed status information for monitoring"""
-    current_timeout_minutes = self._get_current_recovery_timeout_minutes()
-    time_until_retry_minutes = None
-
-    if self.state == CircuitBreakerState.OPEN and self.last_failure_time:
-      elapsed_seconds = time.time() - self.last_failure_time
-      elapsed_minutes = elapsed_seconds / 60
-      time_until_retry_minutes = max(0, current_timeout_minutes - elapsed_minutes)
-
-    # Determine current retry phase
-    retry_phase = "closed"
-    if self.consecutive_circuit_breaks > 0:
-      if self.consecutive_circuit_breaks <= self.fixed_interval_retries:
-        retry_phase = f"fixed-interval (attempt {self.consecutive_circuit_breaks}/{self.fixed_interval_retries})"
-      else:
-        exponential_attempt = min(
-          self.consecutive_circuit_breaks - self.fixed_interval_retries,
-          self.max_exponential_retries,
-        )
-        retry_phase = f"exponential-interval (attempt {exponential_attempt}/{self.max_exponential_retries})"
+    consecutive_circuit_breaks = self.consecutive_circuit_breaks
+    time_until_retry_minutes: float | None = None
+
+    if self._state is _CLOSED and not consecutive_circuit_breaks:
+      # Healthy breaker: the recovery timeout is the un-jittered base and nothing is pending
+      current_timeout_minutes = self._base_interval_minutes
+      retry_phase = "closed"
+    else:
+      current_timeout_minutes = self._get_current_recovery_timeout_minutes()
+
+      if self._state is _OPEN and self._has_failed:
+        elapsed_seconds = (_mono_ns() - self._last_failure_ns) / 1e9
+        elapsed_minutes = elapsed_seconds / 60
+        time_until_retry_minutes = max(0, current_timeout_minutes - elapsed_minutes)
+
+      retry_phase = self._describe_retry_phase(consecutive_circuit_breaks)
 
     return {
-      "state": self.state.value,
+      "state": self._state_name,
       "failure_count": self.failure_count,
-      "consecutive_circuit_breaks": self.consecutive_circuit_breaks,
+      "consecutive_circuit_breaks": consecutive_circuit_breaks,
       "retry_phase": retry_phase,
       "current_recovery_timeout_minutes": current_timeout_minutes,
       "time_until_retry_minutes": time_until_retry_minutes,
-      "config": {
-        "base_interval_minutes": self.base_interval_minutes,
-        "fixed_interval_retries": self.fixed_interval_retries,
-        "max_exponential_retries": self.max_exponential_retries,
-        "jitter_enabled": self.jitter_enabled,
-      },
+      "config": dict(self._config_dict),
     }
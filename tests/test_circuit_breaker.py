@@ -1,9 +1,30 @@
+import copy
+import pickle
+import threading
 import time
+import weakref
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from circuit_breaker import CircuitBreaker, CircuitBreakerState
+from circuit_breaker import CircuitBreaker, CircuitBreakerOpenError, CircuitBreakerState
+
+SECOND_NS = 1_000_000_000
+
+
+# Module-level so pickle can find them by name
+class _SlottedBreaker(CircuitBreaker):
+  __slots__ = ("name",)
+
+  def __init__(self, name, **kwargs):
+    super().__init__(**kwargs)
+    self.name = name
+
+
+class _PlainBreaker(CircuitBreaker):
+  def __init__(self, name, **kwargs):
+    super().__init__(**kwargs)
+    self.name = name
 
 
 class TestCircuitBreaker:
@@ -19,6 +40,19 @@ class TestCircuitBreaker:
     assert cb.failure_count == 0
     assert cb.consecutive_circuit_breaks == 0
 
+  def test_no_instance_dict(self):
+    """Test circuit breaker uses slots instead of a per-instance dict"""
+    cb = CircuitBreaker()
+    assert not hasattr(cb, "__dict__")
+
+  def test_weak_references_supported(self):
+    """Test circuit breakers can be held in weak-reference registries"""
+    cb = CircuitBreaker()
+    registry = weakref.WeakValueDictionary({"endpoint": cb})
+
+    assert weakref.ref(cb)() is cb
+    assert registry["endpoint"] is cb
+
   def test_custom_initialization(self):
     """Test circuit breaker with custom parameters"""
     cb = CircuitBreaker(
@@ -119,7 +153,41 @@ class TestCircuitBreaker:
       cb.call(failing_func)
     assert "Circuit breaker is OPEN" in str(exc_info.value)
 
-  @patch("time.time")
+  def test_open_circuit_raises_open_error(self):
+    """Test rejected calls raise CircuitBreakerOpenError carrying the timeout"""
+    cb = CircuitBreaker(failure_threshold=1, base_interval_minutes=3, jitter_enabled=False)
+
+    def failing_func():
+      raise ValueError("Test failure")
+
+    with pytest.raises(ValueError):
+      cb.call(failing_func)
+
+    with pytest.raises(CircuitBreakerOpenError) as exc_info:
+      cb.call(failing_func)
+    assert exc_info.value.timeout_minutes == 3
+    assert str(exc_info.value) == (
+      "Circuit breaker is OPEN. Service unavailable. Next retry in 3 minutes."
+    )
+
+  def test_open_error_defers_message_formatting(self):
+    """Test CircuitBreakerOpenError stores only the timeout until rendered"""
+    error = CircuitBreakerOpenError(7)
+
+    assert error.args == (7,)
+    assert "Next retry in 7 minutes" in str(error)
+
+  def test_open_error_round_trip_keeps_state(self):
+    """Test pickled and copied CircuitBreakerOpenErrors keep their state and message"""
+    error = CircuitBreakerOpenError(0, CircuitBreakerState.HALF_OPEN)
+
+    for restored in (pickle.loads(pickle.dumps(error)), copy.copy(error), copy.deepcopy(error)):
+      assert restored.state == CircuitBreakerState.HALF_OPEN
+      assert restored.timeout_minutes == 0
+      assert restored.args == (0,)
+      assert str(restored) == str(error)
+
+  @patch("circuit_breaker.circuit_breaker._mono_ns")
   def test_complete_hybrid_pattern_end_to_end(self, mock_time):
     """Test complete hybrid pattern: fixed → exponential → recovery"""
     cb = CircuitBreaker(
@@ -147,7 +215,7 @@ class TestCircuitBreaker:
     assert cb._get_current_recovery_timeout_minutes() == 5
 
     # Wait 5 minutes, try again, fail
-    mock_time.return_value = 300  # 5 minutes
+    mock_time.return_value = 300 * SECOND_NS  # 5 minutes
     cb.state = CircuitBreakerState.HALF_OPEN  # Simulate timeout
     with pytest.raises(ValueError):
       cb.call(failing_func)
@@ -157,7 +225,7 @@ class TestCircuitBreaker:
     # === PHASE 2: Exponential-interval retries ===
 
     # Wait another 5 minutes, try again, fail - enter exponential phase
-    mock_time.return_value = 600  # 10 minutes total
+    mock_time.return_value = 600 * SECOND_NS  # 10 minutes total
     cb.state = CircuitBreakerState.HALF_OPEN
     with pytest.raises(ValueError):
       cb.call(failing_func)
@@ -165,7 +233,7 @@ class TestCircuitBreaker:
     assert cb._get_current_recovery_timeout_minutes() == 25  # 5 * 5^1
 
     # Wait 25 minutes, try again, fail - second exponential
-    mock_time.return_value = 2100  # 35 minutes total
+    mock_time.return_value = 2100 * SECOND_NS  # 35 minutes total
     cb.state = CircuitBreakerState.HALF_OPEN
     with pytest.raises(ValueError):
       cb.call(failing_func)
@@ -175,7 +243,7 @@ class TestCircuitBreaker:
     # === PHASE 3: Recovery ===
 
     # Wait 125 minutes, try again, succeed - should reset completely
-    mock_time.return_value = 9600  # 160 minutes total
+    mock_time.return_value = 9600 * SECOND_NS  # 160 minutes total
     cb.state = CircuitBreakerState.HALF_OPEN
     result = cb.call(success_func)
 
@@ -275,7 +343,89 @@ class TestCircuitBreaker:
     assert actual == expected
     assert actual > 1000000  # Should be over 1 million minutes
 
-  @patch("time.time")
+  def test_timeout_table_precomputed(self):
+    """Test timeouts are precomputed per exponential attempt up to the cap"""
+    cb = CircuitBreaker(
+      base_interval_minutes=5,
+      fixed_interval_retries=2,
+      max_exponential_retries=2,
+      jitter_enabled=False,
+    )
+
+    assert cb._timeouts == [5, 25, 125]
+
+    cb.consecutive_circuit_breaks = 2  # Still in the fixed-interval phase
+    assert cb._get_current_recovery_timeout_minutes() == 5
+
+    cb.consecutive_circuit_breaks = 100  # Beyond the table, uses the capped value
+    assert cb._get_current_recovery_timeout_minutes() == 125
+
+  def test_precomputed_tables_do_not_grow_with_fixed_retries(self):
+    """Test huge fixed_interval_retries values do not inflate precomputed state"""
+    cb = CircuitBreaker(fixed_interval_retries=5_000_000, max_exponential_retries=2)
+
+    assert len(cb._timeouts) == 3
+    assert len(cb._exponential_retry_phases) == 2
+
+    cb.consecutive_circuit_breaks = 4_000_000
+    assert cb.get_status_info()["retry_phase"] == "fixed-interval (attempt 4000000/5000000)"
+
+    cb.consecutive_circuit_breaks = 5_000_001
+    assert cb.get_status_info()["retry_phase"] == "exponential-interval (attempt 1/2)"
+
+  def test_precomputed_tables_do_not_grow_with_exponential_retries(self):
+    """Test huge max_exponential_retries values are computed on demand past the table"""
+    cb = CircuitBreaker(
+      base_interval_minutes=60,
+      fixed_interval_retries=1,
+      max_exponential_retries=20_000,
+      jitter_enabled=False,
+    )
+
+    assert len(cb._timeouts) <= 33
+    assert len(cb._exponential_retry_phases) <= 32
+
+    cb.consecutive_circuit_breaks = 3  # Within the table
+    assert cb._get_current_recovery_timeout_minutes() == 60 * 60**2
+
+    cb.consecutive_circuit_breaks = 5_001  # Past the table
+    assert cb._get_current_recovery_timeout_minutes() == 60 * 60**5_000
+    assert cb.get_status_info()["retry_phase"] == "exponential-interval (attempt 5000/20000)"
+
+    cb.consecutive_circuit_breaks = 50_000  # Past the exponential cap
+    assert cb._get_current_recovery_timeout_minutes() == 60 * 60**20_000
+    assert cb.get_status_info()["retry_phase"] == "exponential-interval (attempt 20000/20000)"
+
+  def test_jitter_toggle_keeps_precomputed_tables(self):
+    """Test toggling jitter only updates the reported config"""
+    cb = CircuitBreaker()
+    timeouts = cb._timeouts
+
+    cb.jitter_enabled = False
+
+    assert cb._timeouts is timeouts
+    assert cb.get_status_info()["config"]["jitter_enabled"] is False
+
+  def test_config_changes_rebuild_precomputed_tables(self):
+    """Test updating configuration after construction is reflected everywhere"""
+    cb = CircuitBreaker(
+      base_interval_minutes=5,
+      fixed_interval_retries=1,
+      max_exponential_retries=2,
+      jitter_enabled=False,
+    )
+
+    cb.base_interval_minutes = 7
+    cb.fixed_interval_retries = 2
+    cb.consecutive_circuit_breaks = 3
+    assert cb._get_current_recovery_timeout_minutes() == 49  # 7 * 7^1
+
+    status = cb.get_status_info()
+    assert status["retry_phase"] == "exponential-interval (attempt 1/2)"
+    assert status["config"]["base_interval_minutes"] == 7
+    assert status["config"]["fixed_interval_retries"] == 2
+
+  @patch("circuit_breaker.circuit_breaker._mono_ns")
   def test_circuit_reset_after_timeout(self, mock_time):
     """Test circuit transitions to HALF_OPEN after timeout"""
     cb = CircuitBreaker(failure_threshold=1, base_interval_minutes=1, jitter_enabled=False)
@@ -292,17 +442,35 @@ class TestCircuitBreaker:
     assert cb.state == CircuitBreakerState.OPEN
 
     # Before timeout - should still be blocked
-    mock_time.return_value = 30  # 30 seconds (less than 1 minute)
+    mock_time.return_value = 30 * SECOND_NS  # 30 seconds (less than 1 minute)
     with pytest.raises(Exception):
       cb.call(failing_func)
     assert cb.state == CircuitBreakerState.OPEN
 
     # After timeout - should transition to HALF_OPEN
-    mock_time.return_value = 70  # 70 seconds (more than 1 minute)
+    mock_time.return_value = 70 * SECOND_NS  # 70 seconds (more than 1 minute)
     with pytest.raises(ValueError):  # Call still fails
       cb.call(failing_func)
     # State should have been HALF_OPEN during the call, then back to OPEN
 
+  @patch("circuit_breaker.circuit_breaker._mono_ns")
+  def test_should_attempt_reset_returns_timeout(self, mock_time):
+    """Test reset check reports the timeout it compared against"""
+    cb = CircuitBreaker(failure_threshold=1, base_interval_minutes=2, jitter_enabled=False)
+
+    def failing_func():
+      raise ValueError("Test failure")
+
+    mock_time.return_value = 0
+    with pytest.raises(ValueError):
+      cb.call(failing_func)
+
+    mock_time.return_value = 60 * SECOND_NS
+    assert cb._should_attempt_reset() == (False, 2)
+
+    mock_time.return_value = 120 * SECOND_NS
+    assert cb._should_attempt_reset() == (True, 2)
+
   def test_circuit_recovery_on_success(self):
     """Test circuit resets completely on successful call"""
     cb = CircuitBreaker(failure_threshold=1)
@@ -348,6 +516,41 @@ class TestCircuitBreaker:
     # Should be back to OPEN state
     assert cb.state == CircuitBreakerState.OPEN
 
+  @patch("circuit_breaker.circuit_breaker._mono_ns")
+  def test_failure_while_open_keeps_recovery_window(self, mock_time):
+    """Test a failure reported while OPEN does not restart the recovery window"""
+    cb = CircuitBreaker(failure_threshold=1)
+    cb.state = CircuitBreakerState.OPEN
+    cb._last_failure_ns = 100 * SECOND_NS
+    cb._has_failed = True
+    cb.consecutive_circuit_breaks = 3
+
+    mock_time.return_value = 500 * SECOND_NS
+    cb._on_failure()
+
+    assert cb.failure_count == 1
+    assert cb._last_failure_ns == 100 * SECOND_NS
+    assert cb.consecutive_circuit_breaks == 3
+    mock_time.assert_not_called()
+
+  def test_call_path_follows_state(self):
+    """Test calls are routed by the current state, including direct assignment"""
+    cb = CircuitBreaker(failure_threshold=1)
+
+    def failing_func():
+      raise ValueError("Test failure")
+
+    with pytest.raises(ValueError):
+      cb.call(failing_func)
+
+    cb.state = CircuitBreakerState.HALF_OPEN
+    assert cb.call(lambda: "success") == "success"
+    assert cb.state == CircuitBreakerState.CLOSED
+
+    cb.state = CircuitBreakerState.OPEN
+    with pytest.raises(CircuitBreakerOpenError):
+      cb.call(lambda: "success")
+
   def test_function_exceptions_are_preserved(self):
     """Test that original function exceptions are preserved"""
     cb = CircuitBreaker()
@@ -363,6 +566,19 @@ class TestCircuitBreaker:
       cb.call(custom_exception_func)
     assert str(exc_info.value) == "Custom message"
 
+  def test_function_traceback_preserved(self):
+    """Test that re-raised exceptions keep the original traceback"""
+    cb = CircuitBreaker()
+
+    def failing_func():
+      raise ValueError("Test failure")
+
+    with pytest.raises(ValueError) as exc_info:
+      cb.call(failing_func)
+    # "raise e" would add a second frame for call() on top of the original one
+    assert [entry.name for entry in exc_info.traceback].count("call") == 1
+    assert exc_info.traceback[-1].name == "failing_func"
+
   def test_function_return_values_preserved(self):
     """Test that function return values are preserved"""
     cb = CircuitBreaker()
@@ -409,6 +625,20 @@ class TestCircuitBreaker:
     for timeout in timeouts:
       assert 75 <= timeout <= 125
 
+  def test_jitter_reaches_both_ends_for_small_timeouts(self):
+    """Test jitter spans the full ±range even when the timeout is small"""
+    cb = CircuitBreaker(base_interval_minutes=5, jitter_enabled=True)
+    cb.consecutive_circuit_breaks = 1
+
+    with patch("circuit_breaker.circuit_breaker._random", return_value=0.0):
+      assert cb._get_current_recovery_timeout_minutes() == 4
+
+    with patch("circuit_breaker.circuit_breaker._random", return_value=0.5):
+      assert cb._get_current_recovery_timeout_minutes() == 5
+
+    with patch("circuit_breaker.circuit_breaker._random", return_value=0.9999):
+      assert cb._get_current_recovery_timeout_minutes() == 6
+
   def test_jitter_disabled(self):
     """Test no jitter when disabled"""
     cb = CircuitBreaker(base_interval_minutes=100, jitter_enabled=False)
@@ -434,6 +664,26 @@ class TestCircuitBreaker:
     assert status["current_recovery_timeout_minutes"] == 5
     assert status["time_until_retry_minutes"] is None
 
+  @patch("circuit_breaker.circuit_breaker._random", return_value=0.5)
+  @patch("circuit_breaker.circuit_breaker._mono_ns")
+  def test_status_info_healthy_skips_timeout_computation(self, mock_time, mock_random):
+    """Test status of a healthy breaker needs neither the clock nor jitter"""
+    cb = CircuitBreaker(base_interval_minutes=5, jitter_enabled=True)
+
+    status = cb.get_status_info()
+
+    assert status["current_recovery_timeout_minutes"] == 5
+    assert status["time_until_retry_minutes"] is None
+    mock_random.assert_not_called()
+    mock_time.assert_not_called()
+
+  def test_status_info_state_follows_assignment(self):
+    """Test status info reports the state after it is set directly"""
+    cb = CircuitBreaker()
+
+    cb.state = CircuitBreakerState.HALF_OPEN
+    assert cb.get_status_info()["state"] == "half_open"
+
   def test_status_info_fixed_interval_phase(self):
     """Test status info during fixed-interval phase"""
     cb = CircuitBreaker(fixed_interval_retries=3)
@@ -459,36 +709,38 @@ class TestCircuitBreaker:
     # Should cap at max_exponential_retries (3/3)
     assert status["retry_phase"] == "exponential-interval (attempt 3/3)"
 
-  @patch("time.time")
+  @patch("circuit_breaker.circuit_breaker._mono_ns")
   def test_time_until_retry_calculation(self, mock_time):
     """Test time until retry calculation"""
     cb = CircuitBreaker(base_interval_minutes=10, jitter_enabled=False)
 
     # Set circuit to open state
-    mock_time.return_value = 100
+    mock_time.return_value = 100 * SECOND_NS
     cb.state = CircuitBreakerState.OPEN
-    cb.last_failure_time = 100
+    cb._last_failure_ns = 100 * SECOND_NS
+    cb._has_failed = True
     cb.consecutive_circuit_breaks = 1
 
     # Check time until retry after 3 minutes
-    mock_time.return_value = 280  # 3 minutes later
+    mock_time.return_value = 280 * SECOND_NS  # 3 minutes later
     status = cb.get_status_info()
 
     expected_time_until_retry = 10 - 3  # 10 min timeout - 3 min elapsed
     assert abs(status["time_until_retry_minutes"] - expected_time_until_retry) < 0.1
 
-  @patch("time.time")
+  @patch("circuit_breaker.circuit_breaker._mono_ns")
   def test_time_until_retry_past_timeout(self, mock_time):
     """Test time until retry when past timeout (should be 0)"""
     cb = CircuitBreaker(base_interval_minutes=5, jitter_enabled=False)
 
-    mock_time.return_value = 100
+    mock_time.return_value = 100 * SECOND_NS
     cb.state = CircuitBreakerState.OPEN
-    cb.last_failure_time = 100
+    cb._last_failure_ns = 100 * SECOND_NS
+    cb._has_failed = True
     cb.consecutive_circuit_breaks = 1
 
     # Check time until retry after 10 minutes (past the 5-minute timeout)
-    mock_time.return_value = 700  # 10 minutes later
+    mock_time.return_value = 700 * SECOND_NS  # 10 minutes later
     status = cb.get_status_info()
 
     assert status["time_until_retry_minutes"] == 0
@@ -531,8 +783,8 @@ class TestCircuitBreaker:
     assert cb.state in [CircuitBreakerState.OPEN, CircuitBreakerState.HALF_OPEN]
     assert cb.consecutive_circuit_breaks >= 1
 
-  def test_concurrent_access_safety(self):
-    """Test basic thread safety (no race conditions in single-threaded test)"""
+  def test_rapid_alternating_success_and_failure(self):
+    """Test rapidly alternating successes and failures from one caller"""
     cb = CircuitBreaker()
 
     def sometimes_failing_func(should_fail=False):
@@ -553,6 +805,159 @@ class TestCircuitBreaker:
     assert "success" in results
     assert "failed" in results
 
+  def test_half_open_admits_one_trial_call_at_a_time(self):
+    """Test concurrent callers are rejected while a HALF_OPEN trial call is in flight"""
+    cb = CircuitBreaker(failure_threshold=1, jitter_enabled=False)
+    cb.state = CircuitBreakerState.HALF_OPEN
+    cb.consecutive_circuit_breaks = 1
+
+    trial_started = threading.Event()
+    release_trial = threading.Event()
+
+    def slow_failing_trial():
+      trial_started.set()
+      release_trial.wait(timeout=5)
+      raise ValueError("Trial failure")
+
+    def run_trial():
+      try:
+        cb.call(slow_failing_trial)
+      except ValueError:
+        pass
+
+    trial_thread = threading.Thread(target=run_trial)
+    trial_thread.start()
+    assert trial_started.wait(timeout=5)
+
+    # A second caller must not reach the service while the trial is running
+    other_func = MagicMock(return_value="success")
+    with (
+      patch("circuit_breaker.circuit_breaker._random") as mock_random,
+      pytest.raises(CircuitBreakerOpenError) as exc_info,
+    ):
+      cb.call(other_func)
+    other_func.assert_not_called()
+    mock_random.assert_not_called()
+    assert exc_info.value.state == CircuitBreakerState.HALF_OPEN
+    assert exc_info.value.timeout_minutes == 0
+    assert "HALF_OPEN" in str(exc_info.value)
+
+    release_trial.set()
+    trial_thread.join(timeout=5)
+
+    assert cb.state == CircuitBreakerState.OPEN
+    assert cb.consecutive_circuit_breaks == 2
+    assert cb.failure_count == 1
+
+  def test_unrelated_failure_keeps_half_open_trial_slot(self):
+    """Test a failure from a non-trial call does not admit a second concurrent trial"""
+    cb = CircuitBreaker(failure_threshold=5)
+    cb.state = CircuitBreakerState.HALF_OPEN
+
+    trial_started = threading.Event()
+    release_trial = threading.Event()
+
+    def slow_trial():
+      trial_started.set()
+      release_trial.wait(timeout=5)
+      return "success"
+
+    trial_thread = threading.Thread(target=cb.call, args=(slow_trial,))
+    trial_thread.start()
+    assert trial_started.wait(timeout=5)
+
+    # E.g. a call that entered while the circuit was still CLOSED, failing below the threshold
+    cb._on_failure()
+    assert cb.state == CircuitBreakerState.HALF_OPEN
+
+    other_func = MagicMock(return_value="success")
+    with pytest.raises(CircuitBreakerOpenError):
+      cb.call(other_func)
+    other_func.assert_not_called()
+
+    release_trial.set()
+    trial_thread.join(timeout=5)
+    assert cb.state == CircuitBreakerState.CLOSED
+
+  def test_interrupted_non_trial_call_keeps_trial_slot(self):
+    """Test an interrupted call that found the circuit CLOSED leaves the trial slot alone"""
+    cb = CircuitBreaker()
+    cb._trial_in_flight = True  # Held by a trial that has not reported back yet
+
+    def interrupted_func():
+      raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+      cb._call_guarded(interrupted_func, (), {})
+
+    assert cb._trial_in_flight is True
+
+  def test_interrupted_half_open_trial_releases_slot(self):
+    """Test a trial call interrupted by a non-Exception error does not block later trials"""
+    cb = CircuitBreaker(failure_threshold=1)
+    cb.state = CircuitBreakerState.HALF_OPEN
+
+    def interrupted_func():
+      raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+      cb.call(interrupted_func)
+
+    assert cb.call(lambda: "success") == "success"
+    assert cb.state == CircuitBreakerState.CLOSED
+
+  def test_pickle_round_trip(self):
+    """Test circuit breakers can be pickled despite holding a lock"""
+    cb = CircuitBreaker(failure_threshold=1, base_interval_minutes=7)
+
+    def failing_func():
+      raise ValueError("Test failure")
+
+    with pytest.raises(ValueError):
+      cb.call(failing_func)
+
+    restored = pickle.loads(pickle.dumps(cb))
+    assert copy.copy(cb)._lock is not cb._lock
+    assert restored.state == CircuitBreakerState.OPEN
+    assert restored.consecutive_circuit_breaks == 1
+    assert restored.get_status_info()["config"]["base_interval_minutes"] == 7
+    assert restored._lock is not cb._lock
+    with pytest.raises(CircuitBreakerOpenError):
+      restored.call(failing_func)
+
+    # Subclasses keep their own slots or __dict__ attributes along with the base state
+    for subclass_cb in (_SlottedBreaker("slotted", failure_threshold=3), _PlainBreaker("plain")):
+      for copier in (lambda obj: pickle.loads(pickle.dumps(obj)), copy.copy, copy.deepcopy):
+        restored = copier(subclass_cb)
+        assert type(restored) is type(subclass_cb)
+        assert restored.name == subclass_cb.name
+        assert restored.failure_threshold == subclass_cb.failure_threshold
+        assert restored.consecutive_circuit_breaks == 0
+        assert restored.call(lambda: "success") == "success"
+
+  @patch("circuit_breaker.circuit_breaker._mono_ns")
+  def test_pickle_reanchors_failure_time(self, mock_time):
+    """Test an unpickled breaker keeps the elapsed recovery time on a different clock"""
+    cb = CircuitBreaker(failure_threshold=1, base_interval_minutes=10, jitter_enabled=False)
+
+    def failing_func():
+      raise ValueError("Test failure")
+
+    mock_time.return_value = 1_000 * SECOND_NS
+    with pytest.raises(ValueError):
+      cb.call(failing_func)
+
+    mock_time.return_value = 1_180 * SECOND_NS  # 3 minutes after the failure
+    data = pickle.dumps(cb)
+
+    # Another host (or a reboot) whose monotonic clock started much later
+    mock_time.return_value = 5 * SECOND_NS
+    restored = pickle.loads(data)
+
+    assert abs(restored.get_status_info()["time_until_retry_minutes"] - 7) < 0.1
+    mock_time.return_value = 5 * SECOND_NS + 420 * SECOND_NS  # 7 more minutes
+    assert restored._should_attempt_reset() == (True, 10)
+
   def test_status_info_contains_config(self):
     """Test that status info contains configuration details"""
     cb = CircuitBreaker(
@@ -569,3 +974,10 @@ class TestCircuitBreaker:
     assert config["fixed_interval_retries"] == 4
     assert config["max_exponential_retries"] == 6
     assert config["jitter_enabled"] is False
+
+  def test_status_info_config_is_not_shared(self):
+    """Test that mutating a returned config does not affect later status info"""
+    cb = CircuitBreaker(jitter_enabled=False)
+
+    cb.get_status_info()["config"]["jitter_enabled"] = "x"
+    assert cb.get_status_info()["config"]["jitter_enabled"] is False